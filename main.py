@@ -6,20 +6,30 @@ This script initializes logging and launches the Gradio web interface.
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
-from src.config import get_config
+from src.config import get_config, get_prompt_template_path
 from src.ui import create_ui
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('patch_eval.log')
-    ]
+# Configure logging. Records are handed to a queue and written to stdout and
+# the log file by a background listener, so request handlers never block on I/O.
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('patch_eval.log')
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+log_listener = logging.handlers.QueueListener(
+    _log_queue, *_log_handlers, respect_handler_level=True
 )
 
 logger = logging.getLogger(__name__)
@@ -27,16 +37,25 @@ logger = logging.getLogger(__name__)
 
 def main():
     """Main entry point."""
+    log_listener.start()
+    try:
+        _run()
+    finally:
+        # Flush queued records before exiting
+        log_listener.stop()
+
+
+def _run():
+    """Check the environment and serve the UI until it is closed."""
     logger.info("Starting Patch Evaluation Tool")
     
     # Get configuration
     config = get_config()
     
     # Verify prompt template exists
-    from src.config import get_prompt_template_path
     template_path = get_prompt_template_path()
     if not template_path.exists():
-        logger.error(f"Prompt template not found: {template_path}")
+        logger.error("Prompt template not found: %s", template_path)
         print(f"Error: Prompt template not found at {template_path}")
         print("Please ensure prompt_ref.txt exists in the project root.")
         sys.exit(1)
@@ -44,14 +63,15 @@ def main():
     # Create and launch UI
     try:
         demo = create_ui()
-        logger.info(f"Launching server on {config.server_host}:{config.server_port}")
+        logger.info("Launching server on %s:%s", config.server_host, config.server_port)
         demo.launch(
             share=config.share,
             server_name=config.server_host,
-            server_port=config.server_port
+            server_port=config.server_port,
+            max_file_size=config.max_upload_size
         )
     except Exception as e:
-        logger.error(f"Error launching application: {e}", exc_info=True)
+        logger.error("Error launching application: %s", e, exc_info=True)
         sys.exit(1)
 
 
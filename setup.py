@@ -19,10 +19,18 @@ setup(
     packages=find_packages(),
     python_requires=">=3.8",
     install_requires=[
-        "gradio>=4.0.0",
+        "gradio>=4.20.0",
         "openai>=1.0.0",
         "anthropic>=0.18.0",
+        "orjson>=3.6.0",
+        "tenacity>=8.2.0",
+        "aiofiles>=23.1.0",
     ],
+    extras_require={
+        "cache": ["diskcache>=5.0.0"],
+        "http2": ["h2>=4.0.0"],
+        "uring": ["liburing; platform_system == 'Linux'"],
+    },
     entry_points={
         "console_scripts": [
             "patch-eval=main:main",
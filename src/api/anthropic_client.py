@@ -10,15 +10,44 @@ try:
 except ImportError:
     anthropic = None
 
-from .base import BaseAPIClient
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .base import (
+    DEFAULT_JUDGE_SYSTEM_MESSAGE,
+    BaseAPIClient,
+    DeltaCallback,
+)
+from .http_client import get_http_client
 from ..exceptions import APIError
 
 logger = logging.getLogger(__name__)
 
+# Transient errors retried by BaseAPIClient.call
+_RETRYABLE: tuple = ()
+if anthropic is not None:
+    _RETRYABLE += (
+        anthropic.RateLimitError,
+        anthropic.APITimeoutError,
+        anthropic.APIConnectionError,
+        anthropic.InternalServerError,
+    )
+    # HTTP 529; not an InternalServerError subclass, and missing from older SDKs
+    _overloaded = getattr(anthropic, "OverloadedError", None)
+    if _overloaded is not None:
+        _RETRYABLE += (_overloaded,)
+if httpx is not None:
+    _RETRYABLE += (httpx.ReadTimeout, httpx.ConnectError)
+
 
 class AnthropicClient(BaseAPIClient):
     """Anthropic API client."""
     
+    provider_name = "Anthropic"
+    retryable_exceptions = _RETRYABLE
+    
     def __init__(self, api_key: str, base_url: Optional[str] = None):
         """Initialize Anthropic client."""
         if anthropic is None:
@@ -28,62 +57,116 @@ class AnthropicClient(BaseAPIClient):
         
         super().__init__(api_key, base_url)
         
-        client_kwargs = {"api_key": self.api_key}
+        # BaseAPIClient.call owns the retry policy; SDK retries would multiply it
+        client_kwargs = {"api_key": self.api_key, "max_retries": 0}
         if self.base_url:
             client_kwargs["base_url"] = self.base_url
         
-        self.client = anthropic.Anthropic(**client_kwargs)
+        http_client = get_http_client(anthropic)
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
+        
+        self.client = anthropic.AsyncAnthropic(**client_kwargs)
         logger.debug("Initialized Anthropic client")
     
-    def call(
+    async def _call_impl(
         self,
         prompt: str,
         model: str,
         system_message: Optional[str] = None,
         temperature: float = 0.3,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        prompt_prefix: Optional[str] = None,
+        stream: bool = True,
+        on_delta: Optional[DeltaCallback] = None
     ) -> str:
-        """Call Anthropic API."""
-        if system_message is None:
-            system_message = (
-                "You are a strict, detail-oriented code review judge for "
-                "software-engineering patches. Always respond with valid JSON."
-            )
+        """
+        Call Anthropic API.
+        
+        The system message and static prompt prefix are marked with
+        cache_control so Anthropic can serve them from its prompt cache.
+        """
+        system_message = system_message or DEFAULT_JUDGE_SYSTEM_MESSAGE
         
         if max_tokens is None:
             max_tokens = 4096
         
+        if prompt_prefix:
+            user_content = [
+                {"type": "text", "text": prompt_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt}
+            ]
+        else:
+            user_content = prompt
+        
         try:
-            logger.info(f"Calling Anthropic API with model: {model}")
-            message = self.client.messages.create(
+            logger.debug("Calling Anthropic API with model: %s", model)
+            message = await self.client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                system=system_message,
+                system=[
+                    {"type": "text", "text": system_message, "cache_control": {"type": "ephemeral"}}
+                ],
                 messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                    {"role": "user", "content": user_content}
+                ],
+                stream=stream
             )
             
-            # Handle different content block types
-            if not message.content or len(message.content) == 0:
-                raise APIError("No content in response from Anthropic API")
-            
-            content_block = message.content[0]
-            if hasattr(content_block, 'text'):
-                content = content_block.text
-            elif hasattr(content_block, 'type') and content_block.type == 'text':
-                content = content_block.text
+            if stream:
+                content = await self._read_stream(message, on_delta)
             else:
-                content = str(content_block)
+                # Handle different content block types
+                if not message.content or len(message.content) == 0:
+                    raise APIError("No content in response from Anthropic API")
+                
+                content_block = message.content[0]
+                if hasattr(content_block, 'text'):
+                    content = content_block.text
+                elif hasattr(content_block, 'type') and content_block.type == 'text':
+                    content = content_block.text
+                else:
+                    content = str(content_block)
             
             if not content:
                 raise APIError("Empty content in response from Anthropic API")
             
-            logger.debug(f"Successfully received response from Anthropic API ({len(content)} chars)")
+            logger.debug("Successfully received response from Anthropic API (%d chars)", len(content))
             return content
         except APIError:
             raise
+        except _RETRYABLE:
+            raise
         except Exception as e:
-            logger.error(f"Error calling Anthropic API: {e}", exc_info=True)
+            logger.error(
+                "Error calling Anthropic API: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             raise APIError(f"Error calling Anthropic API: {str(e)}") from e
+    
+    @staticmethod
+    async def _read_stream(response, on_delta: Optional[DeltaCallback]) -> str:
+        """
+        Accumulate streamed text deltas until the stream ends.
+        
+        Anthropic has no JSON mode, so the reply may contain braces in prose
+        or wrap the verdict in a markdown fence. The stream is therefore read
+        to the end rather than cut at the first balanced object, and the text
+        is returned as received for the evaluator's markdown and free-text
+        fallbacks.
+        """
+        parts = []
+        try:
+            async for event in response:
+                if event.type != "content_block_delta" or event.delta.type != "text_delta":
+                    continue
+                delta = event.delta.text
+                if not delta:
+                    continue
+                parts.append(delta)
+                if on_delta is not None:
+                    on_delta(delta)
+        finally:
+            await response.close()
+        return "".join(parts)
@@ -2,13 +2,135 @@
 Base API client interface.
 """
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from .batcher import get_batcher
+from .cache import cached
+from ..exceptions import APIError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Retry policy for transient provider errors (rate limits, timeouts, 5xx)
+RETRY_ATTEMPTS = 5
+RETRY_INITIAL_WAIT_S = 1.0
+RETRY_MAX_WAIT_S = 30.0
+
+# Receives each chunk of response text as it is streamed
+DeltaCallback = Callable[[str], None]
+
+# Kept byte-identical across calls so providers can serve it from their prompt cache
+DEFAULT_JUDGE_SYSTEM_MESSAGE = (
+    "You are a strict, detail-oriented code review judge for "
+    "software-engineering patches. Always respond with valid JSON."
+)
+
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """
+    Run an awaitable to completion from synchronous code.
+    
+    All synchronous callers share one event loop so that pooled HTTP
+    connections, which are bound to the loop that opened them, stay usable
+    across calls. Must not be used from within a running event loop.
+    
+    Args:
+        awaitable: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    global _sync_loop
+    if _sync_loop is None or _sync_loop.is_closed():
+        _sync_loop = asyncio.new_event_loop()
+    return _sync_loop.run_until_complete(awaitable)
+
+
+class _JsonObjectScanner:
+    """
+    Incrementally locate the first top-level JSON object in streamed text.
+    
+    Each chunk is scanned exactly once as it arrives, so finding the end of
+    the object costs a single pass over the stream. Braces inside JSON
+    strings, including escaped quotes, are ignored.
+    """
+    
+    def __init__(self):
+        """Initialize the scanner."""
+        self.start = -1
+        self.end = -1
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, chunk: str) -> bool:
+        """
+        Scan the next chunk of text.
+        
+        Args:
+            chunk: Text received after everything fed so far
+        
+        Returns:
+            True once the first top-level object has been closed; start and
+            end then delimit it in the concatenated text
+        """
+        if self.end >= 0:
+            return True
+        
+        depth = self._depth
+        in_string = self._in_string
+        escaped = self._escaped
+        for i, ch in enumerate(chunk, self._pos):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = depth > 0
+            elif ch == "{":
+                if depth == 0:
+                    self.start = i
+                depth += 1
+            elif ch == "}" and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    self.end = i + 1
+                    break
+        
+        self._pos += len(chunk)
+        self._depth = depth
+        self._in_string = in_string
+        self._escaped = escaped
+        return self.end >= 0
 
 
 class BaseAPIClient(ABC):
     """Base class for API clients."""
     
+    # Display name used in error messages
+    provider_name = "API"
+    
+    # Exceptions that _call_impl lets propagate and that are worth retrying
+    retryable_exceptions: Tuple[Type[BaseException], ...] = ()
+    
     def __init__(self, api_key: str, base_url: Optional[str] = None):
         """
         Initialize the API client.
@@ -20,24 +142,129 @@ class BaseAPIClient(ABC):
         self.api_key = api_key
         self.base_url = base_url.strip() if base_url and base_url.strip() else None
     
-    @abstractmethod
-    def call(
+    @cached
+    async def call(
         self,
         prompt: str,
         model: str,
         system_message: Optional[str] = None,
         temperature: float = 0.3,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        cache: Optional[bool] = None,
+        prompt_prefix: Optional[str] = None,
+        stream: bool = True,
+        on_delta: Optional[DeltaCallback] = None,
+        on_retry: Optional[Callable[[], None]] = None
     ) -> str:
         """
         Make an API call.
         
+        Deterministic calls (temperature <= 0.05) are served from the
+        response cache when possible. When dynamic batching is enabled,
+        the call is coalesced with other concurrent calls. Transient
+        provider errors are retried with exponential backoff and jitter;
+        cache hits never reach the retry loop.
+        
         Args:
             prompt: User prompt
             model: Model name to use
             system_message: Optional system message
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
+            cache: Force the response cache on or off, regardless of temperature
+            prompt_prefix: Optional static text sent ahead of the prompt; kept
+                separate so providers can serve it from their prompt cache
+            stream: Stream the response. Clients with a JSON mode stop
+                reading as soon as a complete JSON object has been received
+            on_delta: Optional callback receiving each streamed chunk
+            on_retry: Optional callback invoked before a failed attempt is
+                retried; chunks passed to on_delta after it start a new
+                response, so anything streamed so far should be discarded
+        
+        Returns:
+            Response text from the API
+        
+        Raises:
+            APIError: If the API call fails
+        """
+        request = {
+            "prompt": prompt,
+            "model": model,
+            "system_message": system_message,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "prompt_prefix": prompt_prefix,
+            "stream": stream,
+            "on_delta": on_delta,
+        }
+        
+        def before_sleep(retry_state: RetryCallState) -> None:
+            self._log_retry(retry_state)
+            if on_retry is not None:
+                on_retry()
+        
+        retrying = AsyncRetrying(
+            retry=retry_if_exception_type(self.retryable_exceptions),
+            wait=wait_exponential_jitter(initial=RETRY_INITIAL_WAIT_S, max=RETRY_MAX_WAIT_S),
+            stop=stop_after_attempt(RETRY_ATTEMPTS),
+            before_sleep=before_sleep,
+            reraise=True
+        )
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    return await self._dispatch(request)
+        except self.retryable_exceptions as e:
+            logger.error(
+                "Error calling %s API after %d attempts: %s",
+                self.provider_name, RETRY_ATTEMPTS, e
+            )
+            raise APIError(f"Error calling {self.provider_name} API: {str(e)}") from e
+    
+    def _log_retry(self, retry_state: RetryCallState) -> None:
+        logger.warning(
+            "%s API call failed (attempt %d/%d), retrying in %.1fs: %s",
+            self.provider_name, retry_state.attempt_number, RETRY_ATTEMPTS,
+            retry_state.next_action.sleep, retry_state.outcome.exception()
+        )
+    
+    async def _dispatch(self, request: Dict[str, Any]) -> str:
+        """Send one attempt of a request, through the batcher if enabled."""
+        batcher = get_batcher()
+        if batcher is None:
+            return await self._call_impl(**request)
+        
+        future = await batcher.submit(self, request)
+        return await future
+    
+    @abstractmethod
+    async def _call_impl(
+        self,
+        prompt: str,
+        model: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None,
+        prompt_prefix: Optional[str] = None,
+        stream: bool = True,
+        on_delta: Optional[DeltaCallback] = None
+    ) -> str:
+        """
+        Make the provider API call, bypassing the response cache.
+        
+        Exceptions listed in retryable_exceptions must be raised unwrapped
+        so that call() can retry them; all other errors become APIError.
+        
+        Args:
+            prompt: User prompt
+            model: Model name to use
+            system_message: Optional system message
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            prompt_prefix: Optional static text sent ahead of the prompt
+            stream: Stream the response, stopping once a complete JSON
+                object has been received
+            on_delta: Optional callback receiving each streamed chunk
             
         Returns:
             Response text from the API
@@ -45,4 +272,29 @@ class BaseAPIClient(ABC):
         Raises:
             APIError: If the API call fails
         """
-        raise NotImplementedError("Subclasses must implement the call method")
+        raise NotImplementedError("Subclasses must implement the _call_impl method")
+    
+    def call_sync(
+        self,
+        prompt: str,
+        model: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None,
+        prompt_prefix: Optional[str] = None
+    ) -> str:
+        """
+        Synchronous wrapper around :meth:`call` for CLI use.
+        
+        Must not be used from within a running event loop.
+        """
+        return run_sync(
+            self.call(
+                prompt=prompt,
+                model=model,
+                system_message=system_message,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                prompt_prefix=prompt_prefix
+            )
+        )
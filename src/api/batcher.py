@@ -0,0 +1,157 @@
+"""
+Dynamic micro-batching of concurrent API calls.
+"""
+
+import asyncio
+import atexit
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class DynamicBatcher:
+    """
+    Coalesces API calls that arrive within a short window into one batch.
+    
+    A background task collects up to max_batch_size queued requests, waiting
+    at most batch_wait_timeout_s after the first one, then dispatches the whole
+    batch concurrently.
+    """
+    
+    def __init__(self, max_batch_size: int = 32, batch_wait_timeout_s: float = 0.05):
+        """
+        Initialize the batcher.
+        
+        Args:
+            max_batch_size: Maximum number of requests dispatched together
+            batch_wait_timeout_s: Maximum time to wait for a batch to fill
+        """
+        self.max_batch_size = max_batch_size
+        self.batch_wait_timeout_s = batch_wait_timeout_s
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+        # Cancelled tasks whose loop has not yet run to process it
+        self._cancelled: List[asyncio.Task] = []
+    
+    async def submit(self, client: Any, request: Dict[str, Any]) -> "asyncio.Future[str]":
+        """
+        Queue a request for the next batch.
+        
+        Args:
+            client: API client whose _call_impl handles the request
+            request: Keyword arguments for client._call_impl
+        
+        Returns:
+            Future resolved with the response text or the raised exception
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            # Queues and tasks are bound to the loop they were created on
+            self._cancel_worker()
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        await self._queue.put((client, request, future))
+        return future
+    
+    def close(self) -> None:
+        """
+        Stop the background task.
+        
+        Dispatches still in flight are cancelled along with it. Event loops
+        that are idle are run briefly so the cancellations complete instead
+        of leaving pending tasks behind.
+        """
+        self._cancel_worker()
+        for task in list(self._inflight):
+            self._cancel(task)
+        self._inflight.clear()
+        
+        cancelled, self._cancelled = self._cancelled, []
+        by_loop: Dict[asyncio.AbstractEventLoop, List[asyncio.Task]] = {}
+        for task in cancelled:
+            if not task.done():
+                by_loop.setdefault(task.get_loop(), []).append(task)
+        for loop, tasks in by_loop.items():
+            if not loop.is_closed() and not loop.is_running():
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    
+    def _cancel_worker(self) -> None:
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            self._cancel(worker)
+    
+    def _cancel(self, task: asyncio.Task) -> None:
+        if task.done():
+            return
+        loop = task.get_loop()
+        if loop.is_closed():
+            # Nothing, not even the cancellation, can run on a closed loop
+            return
+        if loop.is_running():
+            # May be running in another thread
+            loop.call_soon_threadsafe(task.cancel)
+        else:
+            # Delivered the next time the loop runs, or by close()
+            task.cancel()
+        self._cancelled = [t for t in self._cancelled if not t.done()]
+        self._cancelled.append(task)
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_wait_timeout_s
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            logger.debug("Dispatching batch of %d API calls", len(batch))
+            task = loop.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+    
+    @staticmethod
+    async def _dispatch(batch: List[Tuple[Any, Dict[str, Any], "asyncio.Future[str]"]]) -> None:
+        results = await asyncio.gather(
+            *[client._call_impl(**request) for client, request, _ in batch],
+            return_exceptions=True
+        )
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+_batcher: Optional[DynamicBatcher] = None
+
+
+def get_batcher() -> Optional[DynamicBatcher]:
+    """Get the process-wide batcher, or None if dynamic batching is disabled."""
+    global _batcher
+    config = get_config()
+    if not config.enable_dynamic_batch:
+        return None
+    
+    if _batcher is None:
+        _batcher = DynamicBatcher(
+            max_batch_size=config.max_batch_size,
+            batch_wait_timeout_s=config.batch_wait_timeout_s
+        )
+        atexit.register(_batcher.close)
+    return _batcher
@@ -0,0 +1,213 @@
+"""
+Response cache for LLM API calls.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from functools import wraps
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+from ..config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Calls at or below this temperature are treated as deterministic and cached
+DETERMINISTIC_TEMPERATURE = 0.05
+
+DEFAULT_CACHE_DIR = Path("~/.cache/patch_eval")
+
+
+def make_cache_key(
+    model: str,
+    prompt: str,
+    system_message: Optional[str],
+    temperature: float,
+    max_tokens: Optional[int],
+    prompt_prefix: Optional[str] = None,
+    provider: Optional[str] = None,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> str:
+    """
+    Build a stable cache key for an API call.
+    
+    The endpoint and API key are part of the key, so different servers
+    exposing the same model name never share entries, and a response is
+    only served to callers using the key that obtained it. Only a digest of
+    the API key enters the key.
+    
+    Args:
+        model: Model name
+        prompt: User prompt
+        system_message: System message
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in response
+        prompt_prefix: Static prefix sent ahead of the prompt
+        provider: Provider name of the client making the call
+        base_url: Custom base URL of the client, if any
+        api_key: API key of the client
+    
+    Returns:
+        Hex-encoded SHA-256 digest of the call parameters
+    """
+    payload = json.dumps(
+        {
+            "model": model,
+            "prompt": prompt,
+            "system": system_message,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "prompt_prefix": prompt_prefix,
+            "provider": provider,
+            "base_url": base_url,
+            "api_key_sha256": (
+                hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else None
+            ),
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """LRU cache of LLM responses bounded by entry count and TTL."""
+    
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: Optional[float] = 3600.0,
+        disk_dir: Optional[Path] = None
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of in-memory entries
+            ttl_seconds: Entry lifetime in seconds, or None to never expire
+            disk_dir: Optional directory to persist entries with diskcache
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._disk = None
+        
+        if disk_dir is not None:
+            if diskcache is None:
+                logger.warning(
+                    "diskcache package not installed, response cache will not persist. "
+                    "Install with: pip install diskcache"
+                )
+            else:
+                self._disk = diskcache.Cache(str(Path(disk_dir).expanduser()))
+                logger.debug("Persisting response cache to %s", disk_dir)
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            if self.ttl_seconds is None or time.monotonic() - stored_at <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+        
+        if self._disk is not None:
+            value = self._disk.get(key)
+            if value is not None:
+                self._remember(key, value)
+                return value
+        
+        return None
+    
+    def set(self, key: str, value: str) -> None:
+        """Store a response under key."""
+        self._remember(key, value)
+        if self._disk is not None:
+            self._disk.set(key, value, expire=self.ttl_seconds)
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+        if self._disk is not None:
+            self._disk.clear()
+    
+    def _remember(self, key: str, value: str) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_response_cache: Optional[LLMCache] = None
+
+
+def get_response_cache() -> LLMCache:
+    """Get the process-wide response cache, creating it on first use."""
+    global _response_cache
+    if _response_cache is None:
+        config = get_config()
+        _response_cache = LLMCache(
+            max_entries=config.response_cache_size,
+            ttl_seconds=config.response_cache_ttl,
+            disk_dir=DEFAULT_CACHE_DIR if config.response_cache_persist else None
+        )
+    return _response_cache
+
+
+def cached(func):
+    """
+    Serve repeated deterministic API calls from the response cache.
+    
+    Wraps BaseAPIClient.call. Responses are cached when temperature is at or
+    below DETERMINISTIC_TEMPERATURE, unless overridden with an explicit
+    cache=True/False argument. Other keyword arguments, such as streaming
+    options, are passed through and do not affect the cache key.
+    """
+    @wraps(func)
+    async def wrapper(
+        self,
+        prompt: str,
+        model: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None,
+        cache: Optional[bool] = None,
+        prompt_prefix: Optional[str] = None,
+        **kwargs: Any
+    ) -> str:
+        use_cache = cache if cache is not None else temperature <= DETERMINISTIC_TEMPERATURE
+        if not use_cache:
+            return await func(
+                self, prompt, model, system_message, temperature, max_tokens,
+                cache, prompt_prefix, **kwargs
+            )
+        
+        response_cache = get_response_cache()
+        key = make_cache_key(
+            model, prompt, system_message, temperature, max_tokens, prompt_prefix,
+            provider=self.provider_name,
+            base_url=self.base_url,
+            api_key=self.api_key
+        )
+        hit = response_cache.get(key)
+        if hit is not None:
+            logger.debug("Response cache hit for model: %s", model)
+            return hit
+        
+        result = await func(
+            self, prompt, model, system_message, temperature, max_tokens,
+            cache, prompt_prefix, **kwargs
+        )
+        response_cache.set(key, result)
+        return result
+    
+    return wrapper
@@ -3,6 +3,7 @@ Factory for creating API clients based on model name.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from .base import BaseAPIClient
@@ -13,6 +14,36 @@ from ..exceptions import APIError
 logger = logging.getLogger(__name__)
 
 
+_CLIENT_CLASSES = {
+    "openai": OpenAIClient,
+    "anthropic": AnthropicClient,
+}
+
+# Lowercased model name prefix (text before the first "-") -> provider
+_PROVIDER_MAP = {
+    "gpt": "openai",
+    "o1": "openai",
+    "deepseek": "openai",
+    "claude": "anthropic",
+}
+
+
+def _normalize_base_url(base_url: Optional[str]) -> Optional[str]:
+    """Normalize a base URL so equivalent URLs share one cached client."""
+    if not base_url or not base_url.strip():
+        return None
+    normalized = base_url.strip().rstrip("/")
+    if normalized != base_url:
+        logger.debug("Normalized base URL %r to %r", base_url, normalized)
+    return normalized
+
+
+@lru_cache(maxsize=16)
+def _cached_client(kind: str, api_key: str, base_url: Optional[str]) -> BaseAPIClient:
+    """Construct a provider client once per (kind, api_key, base_url)."""
+    return _CLIENT_CLASSES[kind](api_key, base_url)
+
+
 def get_api_client(
     model_name: str,
     api_key: str,
@@ -21,6 +52,9 @@ def get_api_client(
     """
     Get the appropriate API client based on model name.
     
+    Clients are cached by provider, API key and base URL, so repeated
+    evaluations reuse the same client and its pooled connections.
+    
     Args:
         model_name: Name of the model (e.g., "gpt-5.2", "deepseek-v3-2", "claude-3-5-sonnet")
         api_key: API key for authentication
@@ -32,17 +66,17 @@ def get_api_client(
     Raises:
         APIError: If the model provider is not supported
     """
-    model_lower = model_name.lower()
+    dash = model_name.find("-")
+    prefix = model_name[:dash] if dash >= 0 else model_name
+    kind = _PROVIDER_MAP.get(prefix.lower())
+    base_url = _normalize_base_url(base_url)
     
-    if model_lower.startswith(("gpt-", "o1-", "deepseek-")):
-        logger.debug(f"Using OpenAI client for model: {model_name}")
-        return OpenAIClient(api_key, base_url)
-    elif model_lower.startswith("claude-"):
-        logger.debug(f"Using Anthropic client for model: {model_name}")
-        return AnthropicClient(api_key, base_url)
-    else:
+    if kind is None:
         # Default to OpenAI for unknown models
         logger.warning(
-            f"Unknown model provider for {model_name}, defaulting to OpenAI"
+            "Unknown model provider for %s, defaulting to OpenAI", model_name
         )
-        return OpenAIClient(api_key, base_url)
+        kind = "openai"
+    else:
+        logger.debug("Using %s client for model: %s", kind, model_name)
+    return _cached_client(kind, api_key, base_url)
@@ -0,0 +1,71 @@
+"""
+Shared HTTP connection pools for API clients.
+"""
+
+import asyncio
+import atexit
+import logging
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+_http_clients: Dict[str, Any] = {}
+
+
+def get_http_client(sdk: ModuleType) -> Optional[Any]:
+    """
+    Get the process-wide pooled HTTP client for a provider SDK.
+    
+    The pool is built with the SDK's own DefaultAsyncHttpxClient so it keeps
+    the SDK's default timeouts and matches the httpx flavour the SDK expects.
+    HTTP/2 is enabled when the h2 package is installed. Connections are bound
+    to the event loop that opened them, so a pool should only be used from a
+    single long-lived loop.
+    
+    Args:
+        sdk: The openai or anthropic module
+    
+    Returns:
+        Shared async HTTP client, or None to let the SDK create its own
+    """
+    client = _http_clients.get(sdk.__name__)
+    if client is not None:
+        return client
+    
+    client_class = getattr(sdk, "DefaultAsyncHttpxClient", None)
+    if client_class is None or httpx is None:
+        return None
+    
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+    )
+    try:
+        client = client_class(http2=True, limits=limits)
+    except ImportError:
+        logger.debug("h2 package not installed, using HTTP/1.1 connection pool")
+        client = client_class(limits=limits)
+    
+    if not _http_clients:
+        atexit.register(_close_http_clients)
+    _http_clients[sdk.__name__] = client
+    return client
+
+
+def _close_http_clients() -> None:
+    for client in _http_clients.values():
+        if client.is_closed:
+            continue
+        try:
+            asyncio.run(client.aclose())
+        except Exception as e:
+            logger.debug("Error closing HTTP client: %s", e)
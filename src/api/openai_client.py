@@ -10,15 +10,41 @@ try:
 except ImportError:
     openai = None
 
-from .base import BaseAPIClient
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .base import (
+    DEFAULT_JUDGE_SYSTEM_MESSAGE,
+    BaseAPIClient,
+    DeltaCallback,
+    _JsonObjectScanner,
+)
+from .http_client import get_http_client
 from ..exceptions import APIError
 
 logger = logging.getLogger(__name__)
 
+# Transient errors retried by BaseAPIClient.call
+_RETRYABLE: tuple = ()
+if openai is not None:
+    _RETRYABLE += (
+        openai.RateLimitError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.InternalServerError,
+    )
+if httpx is not None:
+    _RETRYABLE += (httpx.ReadTimeout, httpx.ConnectError)
+
 
 class OpenAIClient(BaseAPIClient):
     """OpenAI API client."""
     
+    provider_name = "OpenAI"
+    retryable_exceptions = _RETRYABLE
+    
     def __init__(self, api_key: str, base_url: Optional[str] = None):
         """Initialize OpenAI client."""
         if openai is None:
@@ -28,31 +54,43 @@ class OpenAIClient(BaseAPIClient):
         
         super().__init__(api_key, base_url)
         
-        client_kwargs = {"api_key": self.api_key}
+        # BaseAPIClient.call owns the retry policy; SDK retries would multiply it
+        client_kwargs = {"api_key": self.api_key, "max_retries": 0}
         if self.base_url:
             client_kwargs["base_url"] = self.base_url
         
-        self.client = openai.OpenAI(**client_kwargs)
+        http_client = get_http_client(openai)
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
+        
+        self.client = openai.AsyncOpenAI(**client_kwargs)
         logger.debug("Initialized OpenAI client")
     
-    def call(
+    async def _call_impl(
         self,
         prompt: str,
         model: str,
         system_message: Optional[str] = None,
         temperature: float = 0.3,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        prompt_prefix: Optional[str] = None,
+        stream: bool = True,
+        on_delta: Optional[DeltaCallback] = None
     ) -> str:
-        """Call OpenAI API."""
-        if system_message is None:
-            system_message = (
-                "You are a strict, detail-oriented code review judge for "
-                "software-engineering patches. Always respond with valid JSON."
-            )
+        """
+        Call OpenAI API.
+        
+        The static prefix is sent at the very start of the user message so
+        OpenAI's automatic prompt caching can reuse it across calls.
+        """
+        system_message = system_message or DEFAULT_JUDGE_SYSTEM_MESSAGE
+        
+        if prompt_prefix:
+            prompt = prompt_prefix + prompt
         
         try:
-            logger.info(f"Calling OpenAI API with model: {model}")
-            response = self.client.chat.completions.create(
+            logger.debug("Calling OpenAI API with model: %s", model)
+            response = await self.client.chat.completions.create(
                 model=model,
                 messages=[
                     {"role": "system", "content": system_message},
@@ -60,18 +98,57 @@ class OpenAIClient(BaseAPIClient):
                 ],
                 temperature=temperature,
                 max_tokens=max_tokens,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                stream=stream
             )
             
-            if not response.choices:
-                raise APIError("No choices in response from OpenAI API")
+            if stream:
+                content = await self._read_stream(response, on_delta)
+            else:
+                if not response.choices:
+                    raise APIError("No choices in response from OpenAI API")
+                content = response.choices[0].message.content
             
-            content = response.choices[0].message.content
             if not content:
                 raise APIError("Empty content in response from OpenAI API")
             
-            logger.debug(f"Successfully received response from OpenAI API ({len(content)} chars)")
+            logger.debug("Successfully received response from OpenAI API (%d chars)", len(content))
             return content
+        except _RETRYABLE:
+            raise
         except Exception as e:
-            logger.error(f"Error calling OpenAI API: {e}", exc_info=True)
+            logger.error(
+                "Error calling OpenAI API: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             raise APIError(f"Error calling OpenAI API: {str(e)}") from e
+    
+    @staticmethod
+    async def _read_stream(response, on_delta: Optional[DeltaCallback]) -> str:
+        """
+        Accumulate streamed chunks until a complete JSON object arrives.
+        
+        JSON mode guarantees a single object, so only that object is
+        returned, without surrounding whitespace, and it parses on the first try.
+        """
+        parts = []
+        scanner = _JsonObjectScanner()
+        try:
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                if on_delta is not None:
+                    on_delta(delta)
+                if scanner.feed(delta):
+                    break
+        finally:
+            await response.close()
+        
+        content = "".join(parts)
+        if scanner.end >= 0:
+            return content[scanner.start:scanner.end]
+        return content
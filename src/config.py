@@ -3,10 +3,13 @@ Configuration management for the patch evaluation tool.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 from dataclasses import dataclass
 
+_PROJECT_ROOT = Path(__file__).parent.parent
+
 
 @dataclass
 class AppConfig:
@@ -24,10 +27,30 @@ class AppConfig:
     # API configuration
     default_temperature: float = 0.3
     max_tokens: int = 4096
+    # Output cap for evaluation calls; a verdict is well under 1k tokens.
+    # Raise it if verdicts come back truncated.
+    evaluation_max_output_tokens: int = 1024
+    
+    # Response cache configuration
+    response_cache_size: int = 256
+    response_cache_ttl: float = 3600.0
+    response_cache_persist: bool = False
+    # Cache evaluations even at the non-deterministic default temperature
+    response_cache_enabled: bool = False
+    
+    # Dynamic batching configuration
+    enable_dynamic_batch: bool = False
+    max_batch_size: int = 32
+    batch_wait_timeout_s: float = 0.05
     
     # File configuration
     prompt_template_path: str = "prompt_ref.txt"
     max_preview_size: int = 5000
+    # Largest accepted upload, in a format Gradio understands (e.g. "50mb")
+    max_upload_size: str = "50mb"
+    
+    # Reload the prompt template when it changes on disk
+    dev_mode: bool = False
     
     # Supported file types
     supported_file_types: Optional[List[str]] = None
@@ -41,16 +64,34 @@ class AppConfig:
             self.supported_file_types = [".patch", ".diff", ".txt"]
 
 
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
-    """Get application configuration."""
+    """
+    Get application configuration.
+    
+    The configuration is read from the environment once and shared. Code that
+    changes the environment afterwards (e.g. tests) must call
+    get_config.cache_clear() and get_prompt_template_path.cache_clear().
+    """
     return AppConfig(
         server_host=os.getenv("SERVER_HOST", "127.0.0.1"),
         server_port=int(os.getenv("SERVER_PORT", "7860")),
         share=os.getenv("SHARE", "false").lower() == "true",
         prompt_template_path=os.getenv("PROMPT_TEMPLATE_PATH", "prompt_ref.txt"),
+        dev_mode=os.getenv("PATCH_EVAL_DEV", "false").lower() == "true",
+        response_cache_size=int(os.getenv("RESPONSE_CACHE_SIZE", "256")),
+        response_cache_ttl=float(os.getenv("RESPONSE_CACHE_TTL", "3600")),
+        response_cache_persist=os.getenv("RESPONSE_CACHE_PERSIST", "false").lower() == "true",
+        response_cache_enabled=os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true",
+        enable_dynamic_batch=os.getenv("ENABLE_DYNAMIC_BATCH", "false").lower() == "true",
+        max_batch_size=int(os.getenv("MAX_BATCH_SIZE", "32")),
+        batch_wait_timeout_s=float(os.getenv("BATCH_WAIT_TIMEOUT_S", "0.05")),
+        evaluation_max_output_tokens=int(os.getenv("EVALUATION_MAX_OUTPUT_TOKENS", "1024")),
+        max_upload_size=os.getenv("MAX_UPLOAD_SIZE", "50mb"),
     )
 
 
+@lru_cache(maxsize=1)
 def get_prompt_template_path() -> Path:
     """Get the path to the prompt template file."""
     config = get_config()
@@ -58,7 +99,6 @@ def get_prompt_template_path() -> Path:
     
     if not template_path.is_absolute():
         # Try relative to project root
-        project_root = Path(__file__).parent.parent
-        template_path = project_root / config.prompt_template_path
+        template_path = _PROJECT_ROOT / config.prompt_template_path
     
     return template_path
@@ -2,18 +2,57 @@
 Patch evaluation logic.
 """
 
+import asyncio
 import json
 import logging
-from typing import Tuple, Optional
+import re
+from typing import Any, Callable, Dict, Tuple, Optional
 
+import orjson
+
+from .api.base import DeltaCallback, run_sync
 from .api.factory import get_api_client
-from .utils.file_utils import read_patch_file, format_prompt
+from .utils.file_utils import read_patch_file_async, format_prompt
 from .exceptions import ValidationError, APIError, PromptTemplateError
 from .config import get_config
 
 logger = logging.getLogger(__name__)
 
-logger = logging.getLogger(__name__)
+# (score name, points per score point) used to compute overall_score
+_SCORE_WEIGHTS = (
+    ("functional_correctness", 9),
+    ("completeness_coverage", 7),
+    ("equivalence_to_ground_truth", 4),
+)
+
+_JSON_CODE_BLOCK_RE = re.compile(r"```json\s*(.*?)```", re.DOTALL)
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _to_pretty_json(parsed: Any) -> str:
+    """Serialize a parsed response as indented JSON."""
+    return orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+def _extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Find the first decodable JSON object embedded in free text.
+    
+    Args:
+        text: Text that may contain a JSON object
+    
+    Returns:
+        The decoded object, or None if no object could be decoded
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, start)
+            return parsed
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+    return None
 
 
 class PatchEvaluator:
@@ -55,13 +94,13 @@ class PatchEvaluator:
         if not generated_file:
             raise ValidationError("Generated patch file is required")
     
-    def read_patches(
+    async def read_patches(
         self,
         ground_truth_file: str,
         generated_file: str
     ) -> Tuple[str, str]:
         """
-        Read patch files.
+        Read both patch files concurrently.
         
         Args:
             ground_truth_file: Path to ground truth patch file
@@ -74,11 +113,13 @@ class PatchEvaluator:
             ValidationError: If files cannot be read
         """
         try:
-            ground_truth_patch = read_patch_file(ground_truth_file)
+            ground_truth_patch, generated_patch = await asyncio.gather(
+                read_patch_file_async(ground_truth_file),
+                read_patch_file_async(generated_file)
+            )
             if not ground_truth_patch:
                 raise ValidationError("Ground truth patch file is empty")
             
-            generated_patch = read_patch_file(generated_file)
             if not generated_patch:
                 raise ValidationError("Generated patch file is empty")
             
@@ -87,10 +128,13 @@ class PatchEvaluator:
         except ValidationError:
             raise
         except Exception as e:
-            logger.error("Error reading patch files: %s", e, exc_info=True)
+            logger.error(
+                "Error reading patch files: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             raise ValidationError(f"Error reading patch files: {str(e)}") from e
     
-    def evaluate(
+    async def evaluate(
         self,
         api_key: str,
         issue_statement: str,
@@ -99,7 +143,9 @@ class PatchEvaluator:
         ground_truth_file: str,
         generated_file: str,
         optional_notes: str = "",
-        repo_url: Optional[str] = None
+        repo_url: Optional[str] = None,
+        on_delta: Optional[DeltaCallback] = None,
+        on_retry: Optional[Callable[[], None]] = None
     ) -> Tuple[str, Optional[str]]:
         """
         Evaluate a generated patch against a ground truth patch.
@@ -113,6 +159,9 @@ class PatchEvaluator:
             generated_file: Path to generated patch file
             optional_notes: Optional additional notes or constraints
             repo_url: Optional repository URL for context
+            on_delta: Optional callback receiving the raw response as it streams in
+            on_retry: Optional callback invoked when the API call is retried;
+                text already passed to on_delta should then be discarded
             
         Returns:
             Tuple of (result_json_string, error_message)
@@ -125,13 +174,13 @@ class PatchEvaluator:
             )
             
             # Read patch files
-            ground_truth_patch, generated_patch = self.read_patches(
+            ground_truth_patch, generated_patch = await self.read_patches(
                 ground_truth_file, generated_file
             )
             
             # Format prompt
             try:
-                prompt = format_prompt(
+                prompt_prefix, prompt = format_prompt(
                     issue_statement=issue_statement,
                     generated_patch=generated_patch,
                     ground_truth_patch=ground_truth_patch,
@@ -140,15 +189,24 @@ class PatchEvaluator:
                 )
             except PromptTemplateError as e:
                 return "", str(e)
+            finally:
+                # The prompt holds its own copy; release the patch texts so
+                # they are not kept alive for the whole API round trip
+                del ground_truth_patch, generated_patch
             
             # Get API client and make call
             try:
                 api_client = get_api_client(model_name, api_key, base_url)
-                result = api_client.call(
+                result = await api_client.call(
                     prompt=prompt,
+                    prompt_prefix=prompt_prefix,
                     model=model_name,
                     temperature=self.config.default_temperature,
-                    max_tokens=self.config.max_tokens
+                    max_tokens=self.config.evaluation_max_output_tokens,
+                    # None leaves the decision to the temperature check
+                    cache=True if self.config.response_cache_enabled else None,
+                    on_delta=on_delta,
+                    on_retry=on_retry
                 )
             except APIError as e:
                 return "", str(e)
@@ -157,74 +215,64 @@ class PatchEvaluator:
             if not result:
                 return "", "No response received from API"
             
-            if result.strip().startswith("Error"):
-                return "", result
-            
             try:
-                parsed = json.loads(result)
+                parsed = orjson.loads(result)
                 
                 # Validate required fields in the response
                 if not isinstance(parsed, dict):
                     raise ValueError("Response is not a JSON object")
                 
-                # Validate scores are in correct range
+                # Validate scores and verify overall_score in a single pass
                 if "scores" in parsed:
                     scores = parsed["scores"]
-                    for score_name, score_value in scores.items():
+                    expected_total = 0
+                    for score_name, weight in _SCORE_WEIGHTS:
+                        score_value = scores.get(score_name)
+                        if score_value is None:
+                            logger.debug("Score %s is missing", score_name)
+                            continue
                         if not isinstance(score_value, (int, float)):
-                            logger.warning("Score %s is not a number: %s", score_name, score_value)
-                        elif not (0 <= score_value <= 5):
-                            logger.warning("Score %s out of range (0-5): %s", score_name, score_value)
-                
-                # Validate overall_score if present and verify calculation
-                if "overall_score" in parsed and "scores" in parsed:
-                    overall = parsed["overall_score"]
-                    scores = parsed["scores"]
-                    if not isinstance(overall, (int, float)):
-                        logger.warning("Overall score is not a number: %s", overall)
-                    elif not (0 <= overall <= 100):
-                        logger.warning("Overall score out of range (0-100): %s", overall)
-                    else:
-                        # Verify overall_score matches expected calculation
-                        a = scores.get("functional_correctness", 0)
-                        b = scores.get("completeness_coverage", 0)
-                        c = scores.get("equivalence_to_ground_truth", 0)
-                        expected = round((a * 9) + (b * 7) + (c * 4))
-                        if abs(overall - expected) > 1:  # Allow 1 point difference for rounding
-                            logger.warning(
-                                "Overall score mismatch: expected %d (from scores A=%.1f, B=%.1f, C=%.1f), got %s",
-                                expected, a, b, c, overall
-                            )
+                            logger.debug("Score %s is not a number: %s", score_name, score_value)
+                            continue
+                        if not (0 <= score_value <= 5):
+                            logger.debug("Score %s out of range (0-5): %s", score_name, score_value)
+                        expected_total += score_value * weight
+                    
+                    if "overall_score" in parsed:
+                        overall = parsed["overall_score"]
+                        if not isinstance(overall, (int, float)):
+                            logger.warning("Overall score is not a number: %s", overall)
+                        elif not (0 <= overall <= 100):
+                            logger.warning("Overall score out of range (0-100): %s", overall)
+                        else:
+                            expected = round(expected_total)
+                            if abs(overall - expected) > 1:  # Allow 1 point difference for rounding
+                                logger.warning(
+                                    "Overall score mismatch: expected %d from weighted scores, got %s",
+                                    expected, overall
+                                )
                 
-                formatted_result = json.dumps(parsed, indent=2)
+                formatted_result = _to_pretty_json(parsed)
                 logger.info("Successfully evaluated patch")
                 return formatted_result, None
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 # Try to extract JSON from markdown code block
-                if "```json" in result:
-                    start = result.find("```json") + 7
-                    end = result.find("```", start)
-                    if end > start:
-                        try:
-                            json_content = result[start:end].strip()
-                            parsed = json.loads(json_content)
-                            formatted_result = json.dumps(parsed, indent=2)
-                            logger.info("Successfully evaluated patch (extracted from markdown)")
-                            return formatted_result, None
-                        except json.JSONDecodeError:
-                            logger.warning("Failed to parse JSON from markdown code block")
-                
-                # Try to extract JSON object from text
-                import re
-                json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', result, re.DOTALL)
-                if json_match:
+                match = _JSON_CODE_BLOCK_RE.search(result)
+                if match:
                     try:
-                        parsed = json.loads(json_match.group(0))
-                        formatted_result = json.dumps(parsed, indent=2)
-                        logger.info("Successfully evaluated patch (extracted JSON from text)")
+                        parsed = orjson.loads(match.group(1).strip())
+                        formatted_result = _to_pretty_json(parsed)
+                        logger.info("Successfully evaluated patch (extracted from markdown)")
                         return formatted_result, None
-                    except json.JSONDecodeError:
-                        pass
+                    except orjson.JSONDecodeError:
+                        logger.warning("Failed to parse JSON from markdown code block")
+                
+                # Try to extract JSON object from text
+                parsed = _extract_json_object(result)
+                if parsed is not None:
+                    formatted_result = _to_pretty_json(parsed)
+                    logger.info("Successfully evaluated patch (extracted JSON from text)")
+                    return formatted_result, None
                 
                 logger.warning("API response is not valid JSON: %s", str(e))
                 logger.debug("Response content (first 500 chars): %s", result[:500])
@@ -239,3 +287,32 @@ class PatchEvaluator:
         except Exception as e:
             logger.error("Unexpected error during evaluation: %s", e, exc_info=True)
             return "", f"Unexpected error: {str(e)}"
+    
+    def evaluate_sync(
+        self,
+        api_key: str,
+        issue_statement: str,
+        model_name: str,
+        base_url: Optional[str],
+        ground_truth_file: str,
+        generated_file: str,
+        optional_notes: str = "",
+        repo_url: Optional[str] = None
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Synchronous wrapper around :meth:`evaluate` for CLI use.
+        
+        Must not be used from within a running event loop.
+        """
+        return run_sync(
+            self.evaluate(
+                api_key=api_key,
+                issue_statement=issue_statement,
+                model_name=model_name,
+                base_url=base_url,
+                ground_truth_file=ground_truth_file,
+                generated_file=generated_file,
+                optional_notes=optional_notes,
+                repo_url=repo_url
+            )
+        )
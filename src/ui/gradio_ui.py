@@ -2,26 +2,226 @@
 Gradio UI components for the patch evaluation tool.
 """
 
-import json
+import asyncio
+import atexit
 import logging
-import gradio as gr
+import os
+import re
+import shutil
+import string
+import tempfile
+import threading
+import time
+import uuid
+from functools import lru_cache
+from typing import Optional
+
+import orjson
 
 from ..evaluator import PatchEvaluator
-from ..utils.file_utils import read_patch_file
+from ..utils.file_utils import read_patch_file_head
 from ..config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Characters not allowed in download filenames
+_SANITIZE_RE = re.compile(r"[^\w\-]")
+
+# Directory holding JSON downloads, created on first use
+_DOWNLOAD_DIR: Optional[str] = None
+
+# Second and formatted timestamp of the last download filename
+_last_timestamp = [0, ""]
+
+# Downloads older than this are deleted by a sweep every DOWNLOAD_SWEEP_INTERVAL_S
+DOWNLOAD_MAX_AGE_S = 1800
+DOWNLOAD_SWEEP_INTERVAL_S = 600
+
+# Colors for scores >= 4, >= 3, >= 2 and below 2
+_SCORE_COLORS = (
+    "#10b981",  # green
+    "#f59e0b",  # amber
+    "#f97316",  # orange
+    "#ef4444",  # red
+)
+
+_CARDS_OPEN = """
+<div style="margin: 20px 0;">
+    <div style="display: flex; gap: 15px; flex-wrap: wrap; justify-content: center;">"""
+
+_CARDS_CLOSE = """
+    </div>
+</div>
+"""
+
+_VERDICT_CARD_TMPL = string.Template("""
+        <div style="background: linear-gradient(135deg, ${color}15 0%, ${color}05 100%); 
+                    border: 2px solid ${color}; border-radius: 12px; padding: 20px; 
+                    min-width: 200px; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
+            <div style="font-size: 14px; color: #666; margin-bottom: 8px;">VERDICT</div>
+            <div style="font-size: 32px; font-weight: bold; color: ${color}; margin-bottom: 4px;">${verdict}</div>
+            <div style="font-size: 18px; color: #666;">Overall: ${overall}/100</div>
+        </div>""")
+
+_CARD_TMPL = string.Template("""
+        <div style="background: linear-gradient(135deg, ${color}15 0%, ${color}05 100%); 
+                    border: 2px solid ${color}; border-radius: 12px; padding: 20px; 
+                    min-width: 180px; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
+            <div style="font-size: 14px; color: #666; margin-bottom: 8px;">${title}</div>
+            <div style="font-size: 36px; font-weight: bold; color: ${color}; margin-bottom: 4px;">${score}/5</div>
+            <div style="font-size: 12px; color: #666;">Weight: ${weight}</div>
+        </div>""")
+
+# (score name, card title, weight label) for each score card
+_SCORE_CARDS = (
+    ("functional_correctness", "FUNCTIONAL CORRECTNESS", "45%"),
+    ("completeness_coverage", "COMPLETENESS & COVERAGE", "35%"),
+    ("equivalence_to_ground_truth", "BEHAVIORAL EQUIVALENCE", "20%"),
+)
+
+
+_VERDICT_COLORS = {
+    "PASS": "#10b981",  # green
+    "PARTIAL": "#f59e0b",  # amber
+    "FAIL": "#ef4444"  # red
+}
+
+_VERDICT_EMOJI = {"PASS": "✅", "PARTIAL": "⚠️", "FAIL": "❌"}
+
+_FINDING_EMOJI = {"strength": "✅", "weakness": "⚠️", "risk": "🔴"}
+
+_SUMMARY_TMPL = """
+## {verdict_emoji} Verdict: **{verdict}** | Overall Score: **{overall}/100**
+
+### Summary
+{summary}
+
+### Scores
+- **Functional Correctness**: {func}/5
+- **Completeness & Coverage**: {comp}/5
+- **Behavioral Equivalence**: {equiv}/5
+
+### Confidence
+Confidence Level: **{conf:.1%}**
+
+"""
+
+
+# Initial visibility of the result components, in the order they are output:
+# score cards, summary, JSON, raw text, download, refresh button, errors
+_RESULT_VISIBILITY = (False, True, True, True, False, False, False)
+
+
+def _skip_hidden_updates(updates, visibility, noop):
+    """
+    Replace updates for components that stay hidden with no-op updates.
+    
+    Gradio pushes every non-empty update to the browser, so there is no
+    point resetting the value of a component the user cannot see.
+    
+    Args:
+        updates: gr.update() dicts for the result components
+        visibility: Visibility of those components before the updates
+        noop: Update that leaves a component unchanged, i.e. gr.update();
+            passed in so this module does not import gradio at load time
+    
+    Returns:
+        Tuple of (updates to send, visibility after the updates)
+    """
+    sent = []
+    after = []
+    for update, was_visible in zip(updates, visibility):
+        now_visible = update.get("visible", was_visible)
+        if not was_visible and not now_visible:
+            update = noop
+        sent.append(update)
+        after.append(now_visible)
+    return tuple(sent), tuple(after)
+
+
+def _get_download_dir() -> str:
+    """Get the per-process directory for JSON downloads, creating it if needed."""
+    global _DOWNLOAD_DIR
+    if _DOWNLOAD_DIR is None:
+        _DOWNLOAD_DIR = tempfile.mkdtemp(prefix="patch_eval_")
+        atexit.register(shutil.rmtree, _DOWNLOAD_DIR, ignore_errors=True)
+        _schedule_download_sweep()
+    return _DOWNLOAD_DIR
+
+
+def _download_timestamp() -> str:
+    """Local time for download filenames, formatted at most once per second."""
+    now = int(time.time())
+    if _last_timestamp[0] != now:
+        _last_timestamp[:] = [now, time.strftime("%Y%m%d_%H%M%S", time.localtime(now))]
+    return _last_timestamp[1]
+
+
+def _schedule_download_sweep() -> None:
+    timer = threading.Timer(DOWNLOAD_SWEEP_INTERVAL_S, _sweep_downloads)
+    timer.daemon = True
+    timer.start()
+
+
+def _sweep_downloads() -> None:
+    """Delete expired JSON downloads, then schedule the next sweep."""
+    cutoff = time.time() - DOWNLOAD_MAX_AGE_S
+    try:
+        with os.scandir(_DOWNLOAD_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+    except OSError as e:
+        logger.debug("Error sweeping download directory: %s", e)
+    _schedule_download_sweep()
+
+
+def _score_color(score) -> str:
+    """Color for a 0-5 score."""
+    # Each threshold the score falls below moves one step down the table
+    return _SCORE_COLORS[(score < 4) + (score < 3) + (score < 2)]
+
+
+@lru_cache(maxsize=32)
+def _cached_read(path: str, mtime_ns: int, size: int, max_chars: int) -> str:
+    """Read a preview; mtime and size are part of the key so edits miss."""
+    return read_patch_file_head(path, max_chars)
+
+
+def _read_for_preview(file, max_chars: int) -> str:
+    """Read the start of an uploaded patch file, reusing unchanged files."""
+    if isinstance(file, (str, os.PathLike)):
+        try:
+            st = os.stat(file)
+        except OSError:
+            # Let read_patch_file_head report the problem
+            return read_patch_file_head(file, max_chars)
+        return _cached_read(os.fspath(file), st.st_mtime_ns, st.st_size, max_chars)
+    return read_patch_file_head(file, max_chars)
+
 
 def create_ui():
     """
     Create the Gradio interface.
     
+    This is the module's only entry point. Gradio is imported here rather
+    than at module level, so importing the package stays cheap for callers
+    that never build the UI.
+    
     Returns:
         Gradio Blocks interface
     """
+    import gradio as gr
+    
     config = get_config()
-    evaluator = PatchEvaluator()
+    # Values read by event handlers, bound once instead of per event
+    max_preview_size = config.max_preview_size
+    default_model = config.default_model
+    # Created on the first evaluation rather than when the UI is built
+    evaluator = None
     
     # Custom theme with professional colors
     custom_theme = gr.themes.Soft(
@@ -106,6 +306,7 @@ def create_ui():
                     ground_truth_upload = gr.File(
                         label="Upload Ground Truth Patch",
                         file_types=config.supported_file_types,
+                        file_count="single",
                         type="filepath"
                     )
                     ground_truth_preview = gr.Textbox(
@@ -120,6 +321,7 @@ def create_ui():
                     generated_upload = gr.File(
                         label="Upload Generated Patch",
                         file_types=config.supported_file_types,
+                        file_count="single",
                         type="filepath"
                     )
                     generated_preview = gr.Textbox(
@@ -202,87 +404,75 @@ def create_ui():
                 interactive=False,
                 lines=5
             )
+            
+            # Per-session visibility of the result components
+            result_visibility = gr.State(_RESULT_VISIBILITY)
         
-        # Preview update functions
-        def update_ground_truth_preview(file):
-            """Update ground truth patch preview."""
-            if file:
-                try:
-                    content = read_patch_file(file)
-                    return content[:config.max_preview_size]
-                except Exception as e:
-                    logger.error("Error updating preview: %s", e)
-                    return f"Error: {str(e)}"
-            return ""
-        
-        def update_generated_preview(file):
-            """Update generated patch preview."""
+        # Preview update function, shared by both uploads. trigger_mode is
+        # Gradio's default for .change(), spelled out so the coalescing of
+        # rapid uploads does not depend on that default.
+        def update_preview(file):
+            """Update a patch preview."""
             if file:
                 try:
-                    content = read_patch_file(file)
-                    return content[:config.max_preview_size]
+                    return _read_for_preview(file, max_preview_size)
                 except Exception as e:
                     logger.error("Error updating preview: %s", e)
                     return f"Error: {str(e)}"
             return ""
         
         ground_truth_upload.change(
-            fn=update_ground_truth_preview,
+            fn=update_preview,
             inputs=[ground_truth_upload],
-            outputs=[ground_truth_preview]
+            outputs=[ground_truth_preview],
+            trigger_mode="always_last"
         )
         
         generated_upload.change(
-            fn=update_generated_preview,
+            fn=update_preview,
             inputs=[generated_upload],
-            outputs=[generated_preview]
+            outputs=[generated_preview],
+            trigger_mode="always_last"
         )
         
         # Helper function to create downloadable JSON file
-        def create_json_file(json_data, repo_name=None, pr_id=None):
-            """Create a temporary JSON file for download."""
-            import tempfile
-            import re
-            from datetime import datetime
+        def create_json_file(json_text, repo_name=None, pr_id=None):
+            """Write already-serialized JSON (str or bytes) to a temporary file for download.
             
-            if json_data is None:
+            repo_name and pr_id must already be stripped.
+            """
+            if json_text is None:
                 return None
             
             try:
                 # Build filename components
                 filename_parts = ["patch_evaluation"]
                 
-                if repo_name and repo_name.strip():
+                if repo_name:
                     # Sanitize repo name for filename (replace / and spaces with _)
-                    safe_repo_name = re.sub(r'[^\w\-]', '_', repo_name.strip())
+                    safe_repo_name = _SANITIZE_RE.sub('_', repo_name)
                     filename_parts.append(safe_repo_name)
                 
-                if pr_id and pr_id.strip():
+                if pr_id:
                     # Sanitize PR ID for filename
-                    safe_pr_id = re.sub(r'[^\w\-]', '_', pr_id.strip())
+                    safe_pr_id = _SANITIZE_RE.sub('_', pr_id)
                     filename_parts.append(f"PR{safe_pr_id}")
                 
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename_parts.append(timestamp)
+                filename_parts.append(_download_timestamp())
                 
                 prefix = "_".join(filename_parts) + "_"
                 
-                # Create temporary file
-                temp_file = tempfile.NamedTemporaryFile(
-                    mode='w',
-                    suffix='.json',
-                    prefix=prefix,
-                    delete=False
-                )
-                
-                # Write JSON data
-                if isinstance(json_data, str):
-                    temp_file.write(json_data)
-                else:
-                    json.dump(json_data, temp_file, indent=2)
-                
-                temp_file.close()
-                return temp_file.name
+                # A random suffix keeps concurrent downloads apart
+                path = os.path.join(_get_download_dir(), prefix + uuid.uuid4().hex + ".json")
+                data = json_text.encode("utf-8") if isinstance(json_text, str) else json_text
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                return path
             except Exception as e:
                 logger.error("Error creating JSON file: %s", e)
                 return None
@@ -297,67 +487,27 @@ def create_ui():
             overall = parsed.get("overall_score", 0)
             verdict = parsed.get("verdict", "UNKNOWN")
             
-            # Color mapping for verdicts
-            verdict_colors = {
-                "PASS": "#10b981",  # green
-                "PARTIAL": "#f59e0b",  # amber
-                "FAIL": "#ef4444"  # red
-            }
-            verdict_color = verdict_colors.get(verdict, "#6b7280")
-            
-            # Color mapping for scores (0-5)
-            def get_score_color(score):
-                if score >= 4:
-                    return "#10b981"  # green
-                elif score >= 3:
-                    return "#f59e0b"  # amber
-                elif score >= 2:
-                    return "#f97316"  # orange
-                else:
-                    return "#ef4444"  # red
+            verdict_color = _VERDICT_COLORS.get(verdict, "#6b7280")
             
-            func_score = scores.get("functional_correctness", 0)
-            comp_score = scores.get("completeness_coverage", 0)
-            equiv_score = scores.get("equivalence_to_ground_truth", 0)
-            
-            html = f"""
-            <div style="margin: 20px 0;">
-                <div style="display: flex; gap: 15px; flex-wrap: wrap; justify-content: center;">
-                    <div style="background: linear-gradient(135deg, {verdict_color}15 0%, {verdict_color}05 100%); 
-                                border: 2px solid {verdict_color}; border-radius: 12px; padding: 20px; 
-                                min-width: 200px; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                        <div style="font-size: 14px; color: #666; margin-bottom: 8px;">VERDICT</div>
-                        <div style="font-size: 32px; font-weight: bold; color: {verdict_color}; margin-bottom: 4px;">{verdict}</div>
-                        <div style="font-size: 18px; color: #666;">Overall: {overall}/100</div>
-                    </div>
-                    
-                    <div style="background: linear-gradient(135deg, {get_score_color(func_score)}15 0%, {get_score_color(func_score)}05 100%); 
-                                border: 2px solid {get_score_color(func_score)}; border-radius: 12px; padding: 20px; 
-                                min-width: 180px; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                        <div style="font-size: 14px; color: #666; margin-bottom: 8px;">FUNCTIONAL CORRECTNESS</div>
-                        <div style="font-size: 36px; font-weight: bold; color: {get_score_color(func_score)}; margin-bottom: 4px;">{func_score}/5</div>
-                        <div style="font-size: 12px; color: #666;">Weight: 45%</div>
-                    </div>
-                    
-                    <div style="background: linear-gradient(135deg, {get_score_color(comp_score)}15 0%, {get_score_color(comp_score)}05 100%); 
-                                border: 2px solid {get_score_color(comp_score)}; border-radius: 12px; padding: 20px; 
-                                min-width: 180px; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                        <div style="font-size: 14px; color: #666; margin-bottom: 8px;">COMPLETENESS & COVERAGE</div>
-                        <div style="font-size: 36px; font-weight: bold; color: {get_score_color(comp_score)}; margin-bottom: 4px;">{comp_score}/5</div>
-                        <div style="font-size: 12px; color: #666;">Weight: 35%</div>
-                    </div>
-                    
-                    <div style="background: linear-gradient(135deg, {get_score_color(equiv_score)}15 0%, {get_score_color(equiv_score)}05 100%); 
-                                border: 2px solid {get_score_color(equiv_score)}; border-radius: 12px; padding: 20px; 
-                                min-width: 180px; text-align: center; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-                        <div style="font-size: 14px; color: #666; margin-bottom: 8px;">BEHAVIORAL EQUIVALENCE</div>
-                        <div style="font-size: 36px; font-weight: bold; color: {get_score_color(equiv_score)}; margin-bottom: 4px;">{equiv_score}/5</div>
-                        <div style="font-size: 12px; color: #666;">Weight: 20%</div>
-                    </div>
-                </div>
-            </div>
-            """
-            return html
+            # Collect every block and join once at the end
+            parts = [
+                _CARDS_OPEN,
+                _VERDICT_CARD_TMPL.substitute(
+                    color=verdict_color,
+                    verdict=verdict,
+                    overall=overall
+                ),
+            ]
+            for name, title, weight in _SCORE_CARDS:
+                score = scores.get(name, 0)
+                parts.append(_CARD_TMPL.substitute(
+                    color=_score_color(score),
+                    title=title,
+                    score=score,
+                    weight=weight
+                ))
+            parts.append(_CARDS_CLOSE)
+            return "".join(parts)
         
         # Helper function to create summary markdown
         def create_summary_markdown(parsed):
@@ -366,28 +516,18 @@ def create_ui():
                 return "*Invalid result format*"
             
             verdict = parsed.get("verdict", "UNKNOWN")
-            overall = parsed.get("overall_score", 0)
-            summary = parsed.get("summary", "No summary available.")
             scores = parsed.get("scores", {})
-            confidence = parsed.get("confidence", 0.0)
             
-            verdict_emoji = {"PASS": "✅", "PARTIAL": "⚠️", "FAIL": "❌"}.get(verdict, "❓")
-            
-            md = f"""
-## {verdict_emoji} Verdict: **{verdict}** | Overall Score: **{overall}/100**
-
-### Summary
-{summary}
-
-### Scores
-- **Functional Correctness**: {scores.get('functional_correctness', 'N/A')}/5
-- **Completeness & Coverage**: {scores.get('completeness_coverage', 'N/A')}/5
-- **Behavioral Equivalence**: {scores.get('equivalence_to_ground_truth', 'N/A')}/5
-
-### Confidence
-Confidence Level: **{confidence:.1%}**
-
-"""
+            md = _SUMMARY_TMPL.format_map({
+                "verdict_emoji": _VERDICT_EMOJI.get(verdict, "❓"),
+                "verdict": verdict,
+                "overall": parsed.get("overall_score", 0),
+                "summary": parsed.get("summary", "No summary available."),
+                "func": scores.get("functional_correctness", "N/A"),
+                "comp": scores.get("completeness_coverage", "N/A"),
+                "equiv": scores.get("equivalence_to_ground_truth", "N/A"),
+                "conf": parsed.get("confidence", 0.0),
+            })
             
             # Add key findings if available
             findings = parsed.get("key_findings", [])
@@ -396,26 +536,18 @@ Confidence Level: **{confidence:.1%}**
                 for finding in findings:
                     ftype = finding.get("type", "info")
                     detail = finding.get("detail", "")
-                    emoji = {"strength": "✅", "weakness": "⚠️", "risk": "🔴"}.get(ftype, "ℹ️")
+                    emoji = _FINDING_EMOJI.get(ftype, "ℹ️")
                     md += f"- {emoji} **{ftype.upper()}**: {detail}\n"
                 md += "\n"
             
             return md
         
-        # Evaluation function
-        def run_evaluation(api_key, repo_url, repo_name, pr_id, issue, model, base_url, gt_file, gen_file, notes):
-            """Run patch evaluation."""
-            result, error = evaluator.evaluate(
-                api_key=api_key,
-                issue_statement=issue,
-                model_name=model,
-                base_url=base_url,
-                ground_truth_file=gt_file,
-                generated_file=gen_file,
-                optional_notes=notes or "",
-                repo_url=repo_url
-            )
-            
+        # Displays derived from the most recently rendered result text
+        last_render = {"key": None, "cards": "", "md": ""}
+        
+        # Helper function to render a finished evaluation
+        def render_evaluation(result, error, repo_url, repo_name, pr_id):
+            """Build the component updates for an evaluation result."""
             if error:
                 return (
                     gr.update(value="", visible=False),  # score_cards
@@ -427,30 +559,42 @@ Confidence Level: **{confidence:.1%}**
                     gr.update(value=error, visible=True)  # error_output
                 )
             
+            repo_url = (repo_url or "").strip()
+            repo_name = (repo_name or "").strip()
+            pr_id = (pr_id or "").strip()
+            
             # Try to parse as JSON for better display
             if result:
                 try:
-                    parsed = json.loads(result)
+                    parsed = orjson.loads(result)
+                    
+                    download = result
                     
                     # Add metadata to the result
                     if isinstance(parsed, dict):
                         metadata = {}
-                        if repo_name and repo_name.strip():
-                            metadata["repository_name"] = repo_name.strip()
-                        if pr_id and pr_id.strip():
-                            metadata["pr_id"] = pr_id.strip()
-                        if repo_url and repo_url.strip():
-                            metadata["repository_url"] = repo_url.strip()
+                        if repo_name:
+                            metadata["repository_name"] = repo_name
+                        if pr_id:
+                            metadata["pr_id"] = pr_id
+                        if repo_url:
+                            metadata["repository_url"] = repo_url
                         
                         if metadata:
                             parsed["metadata"] = metadata
-                            # Update the result string with metadata
-                            result = json.dumps(parsed, indent=2)
+                            # Only the download carries metadata; the raw
+                            # output tab shows the model's text unchanged
+                            download = orjson.dumps(parsed, option=orjson.OPT_INDENT_2)
                     
                     # Create formatted displays
-                    score_cards_html = create_score_cards_html(parsed)
-                    summary_md = create_summary_markdown(parsed)
-                    json_file = create_json_file(parsed, repo_name, pr_id)
+                    key = hash(result)
+                    if key != last_render["key"]:
+                        last_render["cards"] = create_score_cards_html(parsed)
+                        last_render["md"] = create_summary_markdown(parsed)
+                        last_render["key"] = key
+                    score_cards_html = last_render["cards"]
+                    summary_md = last_render["md"]
+                    json_file = create_json_file(download, repo_name, pr_id)
                     
                     return (
                         gr.update(value=score_cards_html, visible=True),  # score_cards
@@ -461,7 +605,7 @@ Confidence Level: **{confidence:.1%}**
                         gr.update(visible=True),  # refresh_btn
                         gr.update(value="", visible=False)  # error_output
                     )
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     # If not valid JSON, still try to create file from raw result
                     json_file = create_json_file(result, repo_name, pr_id)
                     return (
@@ -484,29 +628,92 @@ Confidence Level: **{confidence:.1%}**
                     gr.update(value="", visible=False)  # error_output
                 )
         
+        # Evaluation function
+        async def run_evaluation(api_key, repo_url, repo_name, pr_id, issue, model, base_url, gt_file, gen_file, notes, visibility):
+            """Run patch evaluation, streaming the raw response while it arrives."""
+            nonlocal evaluator
+            if evaluator is None:
+                evaluator = PatchEvaluator()
+            
+            chunks = asyncio.Queue()
+            evaluation = asyncio.ensure_future(evaluator.evaluate(
+                api_key=api_key,
+                issue_statement=issue,
+                model_name=model,
+                base_url=base_url,
+                ground_truth_file=gt_file,
+                generated_file=gen_file,
+                optional_notes=notes or "",
+                repo_url=repo_url,
+                on_delta=chunks.put_nowait,
+                # None marks a retry: the next chunks are a fresh response
+                on_retry=lambda: chunks.put_nowait(None)
+            ))
+            
+            streamed = ""
+            try:
+                while not evaluation.done():
+                    next_chunk = asyncio.ensure_future(chunks.get())
+                    await asyncio.wait(
+                        {evaluation, next_chunk}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not next_chunk.done():
+                        next_chunk.cancel()
+                        continue
+                    
+                    received = [next_chunk.result()]
+                    while not chunks.empty():
+                        received.append(chunks.get_nowait())
+                    for chunk in received:
+                        streamed = "" if chunk is None else streamed + chunk
+                    updates, visibility = _skip_hidden_updates((
+                        gr.update(),  # score_cards
+                        gr.update(),  # result_summary
+                        gr.update(),  # result_output
+                        gr.update(value=streamed, visible=True),  # result_text
+                        gr.update(),  # download_json_btn
+                        gr.update(),  # refresh_btn
+                        gr.update()  # error_output
+                    ), visibility, gr.update())
+                    yield (*updates, visibility)
+            finally:
+                if not evaluation.done():
+                    evaluation.cancel()
+            
+            result, error = evaluation.result()
+            updates, visibility = _skip_hidden_updates(
+                render_evaluation(result, error, repo_url, repo_name, pr_id),
+                visibility, gr.update()
+            )
+            yield (*updates, visibility)
+        
         # Clear function
-        def clear_all():
+        def clear_all(visibility):
             """Clear all inputs and results."""
+            updates, visibility = _skip_hidden_updates((
+                gr.update(value=""),  # score_cards
+                gr.update(value="*Evaluation results will appear here after running an evaluation.*"),  # result_summary
+                gr.update(value=None),  # result_output
+                gr.update(value=""),  # result_text
+                gr.update(value=None),  # download_json_btn
+                gr.update(visible=False),  # refresh_btn
+                gr.update(value="")  # error_output
+            ), visibility, gr.update())
             return (
                 "",  # api_key
                 "",  # repo_url
                 "",  # repo_name
                 "",  # pr_id
                 "",  # issue
-                config.default_model,  # model
+                default_model,  # model
                 "",  # base_url
                 None,  # gt_file
                 None,  # gen_file
                 "",  # notes
                 "",  # ground_truth_preview
                 "",  # generated_preview
-                "",  # score_cards
-                "*Evaluation results will appear here after running an evaluation.*",  # result_summary
-                None,  # result_output
-                "",  # result_text
-                None,  # download_json_btn
-                gr.update(visible=False),  # refresh_btn
-                ""  # error_output
+                *updates,
+                visibility
             )
         
         evaluate_btn.click(
@@ -521,7 +728,8 @@ Confidence Level: **{confidence:.1%}**
                 base_url_input,
                 ground_truth_upload,
                 generated_upload,
-                optional_notes
+                optional_notes,
+                result_visibility
             ],
             outputs=[
                 score_cards,
@@ -530,14 +738,15 @@ Confidence Level: **{confidence:.1%}**
                 result_text,
                 download_json_btn,
                 refresh_btn,
-                error_output
+                error_output,
+                result_visibility
             ],
             show_progress=True
         )
         
         clear_btn.click(
             fn=clear_all,
-            inputs=[],
+            inputs=[result_visibility],
             outputs=[
                 api_key_input,
                 repo_url_input,
@@ -557,7 +766,8 @@ Confidence Level: **{confidence:.1%}**
                 result_text,
                 download_json_btn,
                 refresh_btn,
-                error_output
+                error_output,
+                result_visibility
             ]
         )
         
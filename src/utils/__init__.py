@@ -1,5 +1,17 @@
 """Utility functions for the patch evaluation tool."""
 
-from .file_utils import read_patch_file, load_prompt_template, format_prompt
+from .file_utils import (
+    read_patch_file,
+    read_patch_file_async,
+    read_patch_file_head,
+    load_prompt_template,
+    format_prompt,
+)
 
-__all__ = ["read_patch_file", "load_prompt_template", "format_prompt"]
+__all__ = [
+    "read_patch_file",
+    "read_patch_file_async",
+    "read_patch_file_head",
+    "load_prompt_template",
+    "format_prompt",
+]
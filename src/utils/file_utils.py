@@ -2,15 +2,52 @@
 File utility functions for reading and processing patch files.
 """
 
+import asyncio
 import logging
+import mmap
+import os
+import re
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
 
 from ..exceptions import FileReadError, PromptTemplateError
-from ..config import get_prompt_template_path
+from ..config import get_config, get_prompt_template_path
+from .uring_reader import get_uring_engine
 
 logger = logging.getLogger(__name__)
 
+PROMPT_PLACEHOLDERS = (
+    "{ISSUE_STATEMENT}",
+    "{GENERATED_PATCH}",
+    "{GROUND_TRUTH_PATCH}",
+    "{OPTIONAL_NOTES}",
+)
+
+# Matches any placeholder, capturing its name
+_PLACEHOLDER_RE = re.compile(
+    r"\{(" + "|".join(re.escape(p[1:-1]) for p in PROMPT_PLACEHOLDERS) + r")\}"
+)
+
+# Sent in place of the generated patch when it equals the ground truth, so
+# the same diff is not paid for twice
+IDENTICAL_PATCH_MARKER = "<IDENTICAL_TO_GROUND_TRUTH: byte-for-byte the same as the [Ground Truth Patch]>"
+
+# Files larger than this are memory-mapped instead of read through a buffer
+MMAP_THRESHOLD = 64 * 1024
+
+# Files larger than this are still read, but with a warning
+LARGE_FILE_SIZE = 10 * 1024 * 1024
+
+# Template modification time seen by the last load, used in dev mode only
+_TEMPLATE_MTIME: Optional[float] = None
+
 
 def read_patch_file(file: Optional[Union[str, Path]]) -> str:
     """
@@ -32,23 +69,31 @@ def read_patch_file(file: Optional[Union[str, Path]]) -> str:
         # Gradio file upload returns a file path string when type="filepath"
         if isinstance(file, (str, Path)):
             file_path = Path(file)
-            if not file_path.exists():
-                raise FileReadError(f"File not found: {file_path}")
+            # A single stat covers existence, file type and size
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
+                raise FileReadError(f"File not found: {file_path}") from None
             
-            if not file_path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 raise FileReadError(f"Path is not a file: {file_path}")
             
             # Check file size (warn if very large, but still try to read)
-            file_size = file_path.stat().st_size
-            if file_size > 10 * 1024 * 1024:  # 10MB
-                logger.warning(f"Large file detected ({file_size} bytes), reading may be slow")
+            file_size = st.st_size
+            if file_size > LARGE_FILE_SIZE:
+                logger.warning("Large file detected (%d bytes), reading may be slow", file_size)
             
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                if not content.strip():
-                    logger.warning("File appears to be empty: %s", file_path)
-                logger.debug("Successfully read patch file: %s (%d chars)", file_path, len(content))
-                return content
+            if file_size > MMAP_THRESHOLD:
+                with open(file_path, "rb") as f:
+                    content = _decode_mapped(f.fileno())
+            else:
+                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+            
+            if not content.strip():
+                logger.warning("File appears to be empty: %s", file_path)
+            logger.debug("Successfully read patch file: %s (%d chars)", file_path, len(content))
+            return content
         elif hasattr(file, 'read'):
             # File-like object
             try:
@@ -66,51 +111,220 @@ def read_patch_file(file: Optional[Union[str, Path]]) -> str:
     except FileReadError:
         raise
     except Exception as e:
-        logger.error(f"Error reading file: {e}", exc_info=True)
+        logger.error(
+            "Error reading file: %s", e,
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
+        raise FileReadError(f"Error reading file: {str(e)}") from e
+
+
+def read_patch_file_head(file: Optional[Union[str, Path]], max_chars: int) -> str:
+    """
+    Read at most the first max_chars characters of a patch file.
+    
+    Equivalent to read_patch_file(file)[:max_chars], but only the start of
+    the file is read and decoded, so previews of large uploads stay cheap.
+    
+    Args:
+        file: File path string or file-like object from Gradio
+        max_chars: Maximum number of characters to return
+    
+    Returns:
+        The beginning of the patch file as string
+    
+    Raises:
+        FileReadError: If the file cannot be read
+    """
+    if not isinstance(file, (str, Path)):
+        return read_patch_file(file)[:max_chars]
+    
+    # No up-front stat: open() reports missing files and directories itself
+    file_path = Path(file)
+    try:
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            return f.read(max_chars)
+    except FileNotFoundError as e:
+        raise FileReadError(f"File not found: {file_path}") from e
+    except IsADirectoryError as e:
+        raise FileReadError(f"Path is not a file: {file_path}") from e
+    except Exception as e:
+        logger.error(
+            "Error reading file: %s", e,
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
+        raise FileReadError(f"Error reading file: {str(e)}") from e
+
+
+def _decode_patch_bytes(data: Union[bytes, bytearray, mmap.mmap]) -> str:
+    """Decode raw patch bytes (any buffer) the same way text-mode reads do."""
+    content = str(data, "utf-8", "ignore")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _decode_mapped(fd: int) -> str:
+    """Decode an open file straight from a read-only memory map, without a bytes copy."""
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+        return _decode_patch_bytes(mm)
+
+
+async def read_patch_file_async(file: Optional[Union[str, Path]]) -> str:
+    """
+    Read patch file content without blocking the event loop.
+    
+    On Linux with liburing installed, reads are submitted through a shared
+    io_uring so that concurrent calls are batched into one submission.
+    Elsewhere the file is read with aiofiles, except that files larger than
+    MMAP_THRESHOLD are memory-mapped and decoded on the loop's default thread
+    pool, which is also used for everything if aiofiles is not installed.
+    
+    Args:
+        file: File path string or file-like object from Gradio
+    
+    Returns:
+        Content of the patch file as string
+    
+    Raises:
+        FileReadError: If the file cannot be read
+    """
+    if not isinstance(file, (str, Path)):
+        return read_patch_file(file)
+    
+    engine = get_uring_engine()
+    if engine is None and aiofiles is None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, read_patch_file, file)
+    
+    file_path = Path(file)
+    content = None
+    try:
+        if engine is not None:
+            data = await engine.read(file_path)
+        else:
+            async with aiofiles.open(file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > MMAP_THRESHOLD:
+                    loop = asyncio.get_running_loop()
+                    content = await loop.run_in_executor(None, _decode_mapped, f.fileno())
+                else:
+                    data = await f.read()
+    except FileNotFoundError as e:
+        raise FileReadError(f"File not found: {file_path}") from e
+    except IsADirectoryError as e:
+        raise FileReadError(f"Path is not a file: {file_path}") from e
+    except OSError as e:
+        logger.error(
+            "Error reading file: %s", e,
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
         raise FileReadError(f"Error reading file: {str(e)}") from e
+    
+    if content is None:
+        size = len(data)
+        content = _decode_patch_bytes(data)
+    if size > LARGE_FILE_SIZE:
+        logger.warning("Large file detected (%d bytes), reading may be slow", size)
+    
+    if not content.strip():
+        logger.warning("File appears to be empty: %s", file_path)
+    logger.debug("Successfully read patch file: %s (%d chars)", file_path, len(content))
+    return content
+
+
+@lru_cache(maxsize=1)
+def _load_template() -> str:
+    """Read the prompt template from disk."""
+    template_path = get_prompt_template_path()
+    if not template_path.exists():
+        raise PromptTemplateError(
+            f"Prompt template file not found: {template_path}"
+        )
+    
+    with open(template_path, "r", encoding="utf-8") as f:
+        template = f.read()
+        logger.debug("Successfully loaded prompt template from %s", template_path)
+        return template
+
+
+def _invalidate_template_if_modified() -> None:
+    """Drop the cached template if the file changed since it was loaded."""
+    global _TEMPLATE_MTIME
+    try:
+        mtime = get_prompt_template_path().stat().st_mtime
+    except OSError:
+        return
+    
+    if mtime != _TEMPLATE_MTIME:
+        _TEMPLATE_MTIME = mtime
+        _load_template.cache_clear()
 
 
 def load_prompt_template() -> str:
     """
     Load the prompt template from the configured file.
     
+    The template is read from disk once and kept in memory. In dev mode
+    (PATCH_EVAL_DEV=true) it is re-read whenever the file is modified.
+    
     Returns:
         The prompt template content
         
     Raises:
         PromptTemplateError: If the template file cannot be loaded
     """
-    template_path = get_prompt_template_path()
-    
     try:
-        if not template_path.exists():
-            raise PromptTemplateError(
-                f"Prompt template file not found: {template_path}"
-            )
-        
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
-            logger.debug("Successfully loaded prompt template from %s", template_path)
-            return template
+        if get_config().dev_mode:
+            _invalidate_template_if_modified()
+        return _load_template()
     except PromptTemplateError:
         raise
     except Exception as e:
-        logger.error(f"Error loading prompt template: {e}", exc_info=True)
+        logger.error("Error loading prompt template: %s", e, exc_info=True)
         raise PromptTemplateError(
             f"Error loading prompt template: {str(e)}"
         ) from e
 
 
+# Mirror the lru_cache API so callers (e.g. tests) can drop the cached template
+load_prompt_template.cache_clear = _load_template.cache_clear
+
+
+@lru_cache(maxsize=1)
+def _compile_template(template: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Split the template into its static prefix and dynamic segments.
+    
+    Args:
+        template: The prompt template
+    
+    Returns:
+        Tuple of (static_prefix, segments), where segments alternates
+        literal text and placeholder names, starting with literal text
+    """
+    match = _PLACEHOLDER_RE.search(template)
+    split_at = match.start() if match else len(template)
+    return template[:split_at], tuple(_PLACEHOLDER_RE.split(template[split_at:]))
+
+
 def format_prompt(
     issue_statement: str,
     generated_patch: str,
     ground_truth_patch: str,
     optional_notes: str = "",
     repo_url: Optional[str] = None
-) -> str:
+) -> Tuple[str, str]:
     """
     Format the prompt template with actual values.
     
+    The template is split at its first placeholder. Everything before it is
+    returned unchanged as the static prefix, so it stays byte-identical across
+    calls and can be served from the providers' prompt caches. Templates must
+    therefore keep all placeholders after the static rubric.
+    
+    A generated patch identical to the ground truth is replaced by
+    IDENTICAL_PATCH_MARKER.
+    
     Args:
         issue_statement: The issue statement
         generated_patch: The generated patch content
@@ -119,7 +333,8 @@ def format_prompt(
         repo_url: Optional repository URL for context
         
     Returns:
-        Formatted prompt string
+        Tuple of (static_prefix, dynamic_suffix); their concatenation is the
+        full prompt
         
     Raises:
         PromptTemplateError: If the template cannot be formatted
@@ -136,15 +351,28 @@ def format_prompt(
             else:
                 notes_section = repo_context
         
-        prompt = template.replace("{ISSUE_STATEMENT}", issue_statement)
-        prompt = prompt.replace("{GENERATED_PATCH}", generated_patch)
-        prompt = prompt.replace("{GROUND_TRUTH_PATCH}", ground_truth_patch)
-        prompt = prompt.replace("{OPTIONAL_NOTES}", notes_section)
+        if generated_patch and generated_patch == ground_truth_patch:
+            generated_patch = IDENTICAL_PATCH_MARKER
+        
+        static_prefix, segments = _compile_template(template)
+        values = {
+            "ISSUE_STATEMENT": issue_statement,
+            "GENERATED_PATCH": generated_patch,
+            "GROUND_TRUTH_PATCH": ground_truth_patch,
+            "OPTIONAL_NOTES": notes_section,
+        }
+        # Odd segments are placeholder names, even segments literal text
+        prompt = "".join(
+            values[segment] if i % 2 else segment for i, segment in enumerate(segments)
+        )
         
-        logger.debug("Successfully formatted prompt (%d chars)", len(prompt))
-        return prompt
+        logger.debug(
+            "Successfully formatted prompt (%d static + %d dynamic chars)",
+            len(static_prefix), len(prompt)
+        )
+        return static_prefix, prompt
     except PromptTemplateError:
         raise
     except Exception as e:
-        logger.error(f"Error formatting prompt: {e}", exc_info=True)
+        logger.error("Error formatting prompt: %s", e, exc_info=True)
         raise PromptTemplateError(f"Error formatting prompt: {str(e)}") from e
@@ -0,0 +1,222 @@
+"""
+io_uring backed file reads for the event loop.
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import stat
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+if sys.platform == "linux":
+    try:
+        import liburing
+    except ImportError:
+        liburing = None
+else:
+    liburing = None
+
+logger = logging.getLogger(__name__)
+
+# Submission queue depth, also the largest number of reads submitted together
+RING_ENTRIES = 64
+
+_ReadRequest = Tuple[str, asyncio.AbstractEventLoop, "asyncio.Future[bytearray]"]
+
+
+def _set_future(
+    future: "asyncio.Future[bytearray]",
+    result: Optional[bytearray],
+    error: Optional[BaseException]
+) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class IoUringBatchEngine:
+    """
+    Reads whole files through a shared io_uring instance.
+    
+    A background thread owns the ring. Reads queued while it is busy are
+    submitted together with a single io_uring_submit, and each completion
+    resolves its future on the event loop that requested it, so the loop never
+    blocks on disk.
+    """
+    
+    def __init__(self, entries: int = RING_ENTRIES):
+        """
+        Initialize the engine and start its completion thread.
+        
+        Args:
+            entries: Submission queue depth
+        """
+        self.entries = entries
+        self.available = False
+        self._requests: "queue.Queue[_ReadRequest]" = queue.Queue()
+        # Guards available against reads queued while the engine shuts down
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="uring-reader", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+    
+    def read(self, path: Union[str, Path]) -> "asyncio.Future[bytearray]":
+        """
+        Queue a read of the whole file at path.
+        
+        Must be called from a running event loop.
+        
+        Args:
+            path: File to read
+        
+        Returns:
+            Future resolved with the file content, or with the OSError raised
+            while opening or reading the file. If the engine has stopped, the
+            future fails immediately.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self.available:
+                self._requests.put((str(path), loop, future))
+                return future
+        future.set_exception(OSError("io_uring reader is not running"))
+        return future
+    
+    def _run(self) -> None:
+        try:
+            ring = liburing.Ring()
+            liburing.io_uring_queue_init(self.entries, ring, 0)
+            cqe = liburing.Cqe()
+        except Exception as e:
+            logger.debug("io_uring unavailable, using thread reads: %s", e)
+            return
+        else:
+            self.available = True
+        finally:
+            # Never leave __init__ waiting, whatever happened above
+            self._ready.set()
+        
+        batch: List[_ReadRequest] = []
+        try:
+            while True:
+                batch = [self._requests.get()]
+                while len(batch) < self.entries:
+                    try:
+                        batch.append(self._requests.get_nowait())
+                    except queue.Empty:
+                        break
+                self._read_batch(ring, cqe, batch)
+        except Exception as e:
+            # Stop taking requests; later callers fall back to thread reads
+            logger.warning("io_uring reader stopped: %s", e)
+            error = e if isinstance(e, OSError) else OSError(f"io_uring reader stopped: {e}")
+            with self._lock:
+                self.available = False
+            # Reads queued before available was cleared would otherwise wait forever
+            while True:
+                try:
+                    batch.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+            for _, loop, future in batch:
+                self._resolve(loop, future, error=error)
+            liburing.io_uring_queue_exit(ring)
+    
+    def _read_batch(self, ring: Any, cqe: Any, batch: List[_ReadRequest]) -> None:
+        pending: Dict[int, Tuple[int, bytearray, asyncio.AbstractEventLoop, Any]] = {}
+        for tag, (path, loop, future) in enumerate(batch):
+            try:
+                fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+            except OSError as e:
+                self._resolve(loop, future, error=e)
+                continue
+            
+            try:
+                st = os.fstat(fd)
+                if not stat.S_ISREG(st.st_mode):
+                    raise IsADirectoryError(f"Path is not a file: {path}")
+            except OSError as e:
+                os.close(fd)
+                self._resolve(loop, future, error=e)
+                continue
+            
+            buf = bytearray(st.st_size)
+            if not buf:
+                os.close(fd)
+                self._resolve(loop, future, result=buf)
+                continue
+            
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fd, buf, 0)
+            liburing.io_uring_sqe_set_data64(sqe, tag)
+            pending[tag] = (fd, buf, loop, future)
+        
+        if not pending:
+            return
+        liburing.io_uring_submit(ring)
+        
+        while pending:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            res = entry.res
+            tag = liburing.io_uring_cqe_get_data64(entry)
+            liburing.io_uring_cqe_seen(ring, entry)
+            
+            fd, buf, loop, future = pending.pop(tag)
+            try:
+                if res < 0:
+                    raise OSError(-res, os.strerror(-res))
+                # Finish short reads synchronously; they only happen when the
+                # file changes underneath us
+                while res < len(buf):
+                    chunk = os.pread(fd, len(buf) - res, res)
+                    if not chunk:
+                        del buf[res:]
+                        break
+                    buf[res:res + len(chunk)] = chunk
+                    res += len(chunk)
+                self._resolve(loop, future, result=buf)
+            except OSError as e:
+                self._resolve(loop, future, error=e)
+            finally:
+                os.close(fd)
+    
+    @staticmethod
+    def _resolve(
+        loop: asyncio.AbstractEventLoop,
+        future: "asyncio.Future[bytearray]",
+        result: Optional[bytearray] = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        try:
+            loop.call_soon_threadsafe(_set_future, future, result, error)
+        except RuntimeError:
+            # The requesting loop has already been closed
+            pass
+
+
+_engine: Optional[IoUringBatchEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_uring_engine() -> Optional[IoUringBatchEngine]:
+    """Get the process-wide io_uring engine, or None if io_uring is unavailable."""
+    global _engine
+    if liburing is None:
+        return None
+    
+    with _engine_lock:
+        if _engine is None:
+            _engine = IoUringBatchEngine()
+    return _engine if _engine.available else None